@@ -0,0 +1,290 @@
+import hashlib
+import html
+import json
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import matplotlib
+import pandas as pd
+from matplotlib import pyplot as plt
+
+from analysis.analysis_src.bivariate_analysis import CategoricalVSNumericalAnalysis, NumericalVSNumericalAnalysis
+from analysis.analysis_src.missing_values import MissingDataVisualizer
+from analysis.analysis_src.multivariate_analysis import (
+    AndrewsCurve,
+    HeatMap,
+    PairPlot,
+    ParallelPlot,
+    RadViz,
+)
+from analysis.analysis_src.univariate_analysis import CategoricalUnivariateAnalyzer, NumericalUnivariateAnalyzer
+
+MANIFEST_NAME = "manifest.json"
+MULTIVARIATE_PLOTS = {
+    "heatmap": HeatMap,
+    "pairplot": PairPlot,
+    "andrews_curve": AndrewsCurve,
+    "parallel_plot": ParallelPlot,
+    "radviz": RadViz,
+}
+
+
+# Plot functions live at module level so that a FigureSpec can be pickled into a worker process.
+def _plot_numerical_univariate(df: pd.DataFrame, column: str) -> None:
+    NumericalUnivariateAnalyzer(df).plot_distribution(column)
+
+
+def _plot_categorical_univariate(df: pd.DataFrame, column: str) -> None:
+    CategoricalUnivariateAnalyzer(df).plot_distribution(column)
+
+
+def _plot_numerical_bivariate(df: pd.DataFrame, feature1: str, feature2: str, target: str) -> None:
+    NumericalVSNumericalAnalysis(df).plot(feature1, feature2, target)
+
+
+def _plot_categorical_bivariate(df: pd.DataFrame, feature1: str, feature2: str, target: str) -> None:
+    CategoricalVSNumericalAnalysis(df).plot(feature1, feature2, target)
+
+
+def _plot_multivariate(df: pd.DataFrame, kind: str, target: Optional[str]) -> None:
+    MULTIVARIATE_PLOTS[kind]().plot(df, target)
+
+
+def _plot_missing_values(df: pd.DataFrame) -> None:
+    visualizer = MissingDataVisualizer(df)
+    visualizer.visualize_missing_values(visualizer.check_missing_values())
+
+
+class FigureSpec:
+    """Describes one analyzer call of the report and the columns it reads."""
+    def __init__(self, name: str, section: str, plot_fn: Callable[..., None], args: tuple = (),
+                 columns: Optional[List[str]] = None):
+        """
+        Args:
+            name: Unique name of the figure, also used for the asset file names.
+            section: Report section the figure is listed under.
+            plot_fn: Module level function called as plot_fn(df, *args).
+            args: Extra positional arguments for plot_fn.
+            columns: Columns of the frame the figure depends on; None means the whole frame.
+        """
+        self.name = name
+        self.section = section
+        self.plot_fn = plot_fn
+        self.args = args
+        self.columns = columns
+
+    def select(self, df: pd.DataFrame) -> pd.DataFrame:
+        """:returns: the part of the dataframe this figure reads."""
+        return df if self.columns is None else df[self.columns]
+
+    def fingerprint(self, df: pd.DataFrame, formats: Sequence[str], dpi: int) -> str:
+        """ Hashes the input data together with everything that changes the rendered output.
+        :param df: the full report dataframe
+        :param formats: image formats written for the figure
+        :param dpi: resolution of the raster assets
+        :returns: hex digest identifying this rendering"""
+        data = self.select(df)
+        digest = hashlib.sha256()
+        digest.update(repr((self.plot_fn.__name__, self.args, tuple(formats), dpi)).encode())
+        digest.update(repr([(str(c), str(t)) for c, t in data.dtypes.items()]).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        return digest.hexdigest()
+
+
+def univariate_spec(df: pd.DataFrame, column: str) -> FigureSpec:
+    """:returns: a distribution plot spec, categorical for object/category columns and numerical otherwise."""
+    if df[column].dtype.name in ("object", "category"):
+        return FigureSpec(f"univariate_{column}", "Univariate Analysis", _plot_categorical_univariate,
+                          (column,), [column])
+    return FigureSpec(f"univariate_{column}", "Univariate Analysis", _plot_numerical_univariate,
+                      (column,), [column])
+
+
+def bivariate_spec(df: pd.DataFrame, feature1: str, feature2: str, target: str) -> FigureSpec:
+    """:returns: a bivariate plot spec, categorical-vs-numerical when feature1 is categorical."""
+    columns = list(dict.fromkeys([feature1, feature2, target]))
+    plot_fn = _plot_numerical_bivariate
+    if df[feature1].dtype.name in ("object", "category"):
+        plot_fn = _plot_categorical_bivariate
+    return FigureSpec(f"bivariate_{feature1}_vs_{feature2}", "Bivariate Analysis", plot_fn,
+                      (feature1, feature2, target), columns)
+
+
+def multivariate_spec(kind: str, target: Optional[str]) -> FigureSpec:
+    """:returns: a spec for one of the plots in MULTIVARIATE_PLOTS."""
+    if kind not in MULTIVARIATE_PLOTS:
+        raise ValueError(f"Unknown multivariate plot: {kind}")
+    return FigureSpec(f"multivariate_{kind}", "Multivariate Analysis", _plot_multivariate, (kind, target))
+
+
+def missing_values_spec() -> FigureSpec:
+    """:returns: a spec for the missing values bar chart and heatmap."""
+    return FigureSpec("missing_values", "Missing Values", _plot_missing_values)
+
+
+def default_figure_specs(df: pd.DataFrame, target: Optional[str] = None) -> List[FigureSpec]:
+    """ Builds the standard report: every column's distribution, the missing values plots and the
+    multivariate plots (the pair plot is left out as it is by far the slowest to render).
+    :param df: pandas.DataFrame to report on
+    :param target: optional target column used to colour the multivariate plots
+    :returns: list of FigureSpec"""
+    specs = [univariate_spec(df, column) for column in df.columns]
+    specs.append(missing_values_spec())
+    specs.append(multivariate_spec("heatmap", target))
+    if target is not None:
+        specs.extend(multivariate_spec(kind, target) for kind in ("andrews_curve", "parallel_plot", "radviz"))
+    return specs
+
+
+def _asset_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+
+def _init_worker() -> None:
+    # Only the render processes switch backend, the importing process (e.g. a notebook) keeps its own.
+    # The analyzers call plt.show(); on Agg that is a no-op, so figures stay open and can be saved.
+    matplotlib.use("Agg")
+
+
+def _render_figure(spec: FigureSpec, data: pd.DataFrame, asset_dir: str, formats: Sequence[str], dpi: int) -> List[str]:
+    """ Runs one analyzer headless and saves every figure it opened.
+    :returns: asset paths relative to the report directory, grouped per figure in format order"""
+    plt.close("all")
+    with warnings.catch_warnings():
+        # Agg warns that plt.show() cannot display anything.
+        warnings.simplefilter("ignore", UserWarning)
+        spec.plot_fn(data, *spec.args)
+    assets = []
+    base = _asset_name(spec.name)
+    figures = [plt.figure(num) for num in plt.get_fignums()]
+    # Skip the blank figures left behind by plt.figure() calls that a seaborn grid plot replaced.
+    figures = [fig for fig in figures if fig.axes]
+    for i, fig in enumerate(figures):
+        suffix = "" if len(figures) == 1 else f"_{i + 1}"
+        for fmt in formats:
+            file_name = f"{base}{suffix}.{fmt}"
+            fig.savefig(os.path.join(asset_dir, file_name), format=fmt, dpi=dpi, bbox_inches="tight")
+            assets.append(os.path.join("assets", file_name))
+    plt.close("all")
+    return assets
+
+
+class EDAReportGenerator:
+    """Renders the analyzers headless in worker processes and writes a static HTML report."""
+    def __init__(self, output_dir: str, formats: Sequence[str] = ("png", "svg"), dpi: int = 100,
+                 max_workers: Optional[int] = None):
+        """
+        Args:
+            output_dir: Directory for report.html, the assets folder and the manifest.
+            formats: Image formats to save; the first one is embedded in the HTML.
+            dpi: Resolution of the raster assets.
+            max_workers: Number of render processes, defaults to the CPU count.
+        """
+        if not formats:
+            raise ValueError("At least one image format is required.")
+        self.output_dir = output_dir
+        self.asset_dir = os.path.join(output_dir, "assets")
+        self.formats = tuple(formats)
+        self.dpi = dpi
+        self.max_workers = max_workers
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        path = os.path.join(self.output_dir, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _is_fresh(self, entry: Optional[dict], fingerprint: str) -> bool:
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return False
+        return all(os.path.exists(os.path.join(self.output_dir, a)) for a in entry.get("assets", []))
+
+    def _remove_assets(self, assets: Iterable[str]) -> None:
+        for asset in assets:
+            path = os.path.join(self.output_dir, asset)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def generate(self, df: pd.DataFrame, specs: Optional[List[FigureSpec]] = None, target: Optional[str] = None,
+                 title: str = "EDA Report") -> str:
+        """ Renders the figures whose input data changed since the last report and rewrites the HTML.
+        :param df: pandas.DataFrame to report on
+        :param specs: figures to render, defaults to default_figure_specs(df, target)
+        :param target: target column passed to default_figure_specs
+        :param title: report title
+        :returns: path of the written report.html"""
+        if specs is None:
+            specs = default_figure_specs(df, target)
+        names = [spec.name for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError("Figure names must be unique.")
+        os.makedirs(self.asset_dir, exist_ok=True)
+
+        manifest = self._load_manifest()
+        new_manifest = {}
+        stale = []
+        for spec in specs:
+            fingerprint = spec.fingerprint(df, self.formats, self.dpi)
+            if self._is_fresh(manifest.get(spec.name), fingerprint):
+                new_manifest[spec.name] = manifest[spec.name]
+            else:
+                new_manifest[spec.name] = {"fingerprint": fingerprint, "section": spec.section, "assets": []}
+                stale.append(spec)
+        # Old assets of re-rendered or removed figures; a re-render may produce fewer files than before.
+        for name, entry in manifest.items():
+            if name not in new_manifest or new_manifest[name] is not entry:
+                self._remove_assets(entry.get("assets", []))
+
+        if stale:
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker) as executor:
+                futures = {
+                    spec.name: executor.submit(_render_figure, spec, spec.select(df), self.asset_dir,
+                                               self.formats, self.dpi)
+                    for spec in stale
+                }
+                for name, future in futures.items():
+                    new_manifest[name]["assets"] = future.result()
+
+        with open(os.path.join(self.output_dir, MANIFEST_NAME), "w") as f:
+            json.dump(new_manifest, f, indent=2)
+        report_path = os.path.join(self.output_dir, "report.html")
+        with open(report_path, "w") as f:
+            f.write(self._render_html(df, specs, new_manifest, title))
+        return report_path
+
+    def _render_html(self, df: pd.DataFrame, specs: List[FigureSpec], manifest: Dict[str, dict], title: str) -> str:
+        sections: Dict[str, List[str]] = {}
+        for spec in specs:
+            assets = manifest[spec.name]["assets"]
+            embedded = [a for a in assets if a.endswith(f".{self.formats[0]}")]
+            items = [f'<figure><img src="{html.escape(a)}" alt="{html.escape(spec.name)}"></figure>' for a in embedded]
+            links = " ".join(f'<a href="{html.escape(a)}">{html.escape(os.path.basename(a))}</a>' for a in assets)
+            if not items:
+                items = ["<p>No figure produced.</p>"]
+            sections.setdefault(spec.section, []).append(
+                f"<h3>{html.escape(spec.name)}</h3>\n" + "\n".join(items) + f"\n<p>{links}</p>"
+            )
+
+        body = [f"<h1>{html.escape(title)}</h1>",
+                f"<p>Shape: {df.shape[0]} rows x {df.shape[1]} columns</p>",
+                "<h2>Numerical Statistics</h2>",
+                df.describe().to_html()]
+        for section, items in sections.items():
+            body.append(f"<h2>{html.escape(section)}</h2>")
+            body.extend(items)
+        return ("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+                f"<title>{html.escape(title)}</title>\n"
+                "<style>body{font-family:sans-serif;margin:2em;} img{max-width:100%;} "
+                "table{border-collapse:collapse;} td,th{border:1px solid #ccc;padding:2px 6px;}</style>\n"
+                "</head>\n<body>\n" + "\n".join(body) + "\n</body>\n</html>\n")
+
+
+# Use Case
+if __name__ == "__main__":
+    # Run from the repository root: python -m analysis.analysis_src.eda_report
+    wine_df = pd.read_csv("extracted_data/wine.csv")
+    generator = EDAReportGenerator(output_dir="reports/eda")
+    print(f"Report written to {generator.generate(wine_df, target='Class')}")
@@ -0,0 +1,181 @@
+"""
+Command-line entry point for the pipeline.
+
+Settings come from an optional YAML file and are overridden by flags. Thread and memory caps are applied
+before numpy/sklearn are imported, so several runs can share one host without oversubscribing it:
+
+    python -m pipeline.cli --config pipeline/pipeline_config.yaml --model random_forest --model svc \\
+        --n-jobs 2 --blas-threads 1 --memory-limit-mb 2048
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from pipeline.run_pipeline import DEFAULT_FILE_PATH, DEFAULT_MODEL_TYPE, DEFAULT_SCALE_METHOD, DEFAULT_TARGET, run_local
+
+BLAS_THREAD_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# Config entries that hold paths; relative ones are resolved against the directory of the config file.
+PATH_KEYS = ("file_path", "artifact_dir")
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "file_path": DEFAULT_FILE_PATH,
+    "target": DEFAULT_TARGET,
+    "models": [DEFAULT_MODEL_TYPE],
+    "n_jobs": -1,
+    "scale_method": DEFAULT_SCALE_METHOD,
+    "n_components": None,
+    "artifact_dir": None,
+    "blas_threads": None,
+    "memory_limit_mb": None,
+    "orchestrated": False,
+}
+
+
+def load_config(path: Optional[str]) -> Dict[str, Any]:
+    """ Reads the YAML config on top of DEFAULT_CONFIG.
+    :param path: path to the YAML file, or None for the defaults
+    :returns: the merged config, with relative paths resolved against the directory of the YAML file"""
+    config = dict(DEFAULT_CONFIG)
+    if path is None:
+        return config
+    import yaml
+
+    with open(path) as f:
+        loaded = yaml.safe_load(f) or {}
+    if not isinstance(loaded, dict):
+        raise ValueError(f"Config file {path} must contain a mapping.")
+    unknown = set(loaded) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+    if isinstance(loaded.get("models"), str):
+        loaded["models"] = [loaded["models"]]
+    config_dir = os.path.dirname(os.path.abspath(path))
+    for key in PATH_KEYS:
+        if loaded.get(key) is not None:
+            loaded[key] = os.path.normpath(os.path.join(config_dir, os.path.expanduser(str(loaded[key]))))
+    config.update(loaded)
+    return config
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """ Reads the config file and the command-line flags; invalid settings exit with a usage error (status 2).
+    :returns: the config file merged with the command-line flags, flags win"""
+    parser = argparse.ArgumentParser(description="Train and evaluate the wine quality models.")
+    parser.add_argument("--config", help="YAML file with any of: " + ", ".join(DEFAULT_CONFIG))
+    parser.add_argument("--file-path", dest="file_path", help="Zip file with the dataset.")
+    parser.add_argument("--target", help="Target column.")
+    parser.add_argument("--model", dest="models", action="append",
+                        help="Model type to train; repeat the flag to train several.")
+    parser.add_argument("--n-jobs", dest="n_jobs", type=int, help="Worker threads per estimator (-1 = all cores).")
+    parser.add_argument("--scale-method", dest="scale_method", choices=["standard", "robust", "none"],
+                        help="Scaler applied before PCA in the feature engineering step.")
+    parser.add_argument("--n-components", dest="n_components", type=int, help="Principal components to keep.")
+    parser.add_argument("--artifact-dir", dest="artifact_dir",
+                        help="Directory to save each model's fitted inference pipeline in (local runs only).")
+    parser.add_argument("--blas-threads", dest="blas_threads", type=int,
+                        help="Thread cap for the BLAS/OpenMP pools used by numpy and sklearn.")
+    parser.add_argument("--memory-limit-mb", dest="memory_limit_mb", type=int,
+                        help="Address space limit of the process in MiB.")
+    parser.add_argument("--orchestrated", dest="orchestrated", action="store_true", default=None,
+                        help="Run through the ZenML pipeline instead of in-process.")
+    args = vars(parser.parse_args(argv))
+
+    try:
+        config = load_config(args.pop("config"))
+        config.update({key: value for key, value in args.items() if value is not None})
+        if config["scale_method"] == "none":
+            config["scale_method"] = None
+        validate_config(config)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    return config
+
+
+def validate_config(config: Dict[str, Any]) -> None:
+    """ Raises ValueError for settings that would only fail after the data is loaded. """
+    from src.model_building import MODEL_BUILDERS
+
+    if not config["models"]:
+        raise ValueError("At least one model type is required.")
+    for model_type in config["models"]:
+        if model_type not in MODEL_BUILDERS:
+            raise ValueError(f"Unknown model type: {model_type}")
+    if config["orchestrated"] and config["artifact_dir"] is not None:
+        raise ValueError("artifact_dir only applies to local runs; orchestrated runs store the inference "
+                         "pipeline as the ZenML 'inference_pipeline' artifact.")
+    if config["n_jobs"] == 0:
+        raise ValueError("n_jobs must be a positive number or negative (-1 = all cores).")
+    if config["blas_threads"] is not None and config["blas_threads"] < 1:
+        raise ValueError("blas_threads must be at least 1.")
+    if config["memory_limit_mb"] is not None and config["memory_limit_mb"] < 1:
+        raise ValueError("memory_limit_mb must be at least 1.")
+
+
+def apply_resource_limits(blas_threads: Optional[int], memory_limit_mb: Optional[int]) -> None:
+    """
+    Caps the BLAS/OpenMP thread pools and the process memory.
+
+    The environment variables only take effect for libraries loaded afterwards, which is why this runs
+    before anything imports numpy; pools that are already loaded are capped by threadpoolctl in main().
+    """
+    if blas_threads is not None:
+        for variable in BLAS_THREAD_VARIABLES:
+            os.environ[variable] = str(blas_threads)
+    if memory_limit_mb is not None:
+        try:
+            import resource
+        except ImportError:
+            print("Memory limits are not supported on this platform; ignoring memory_limit_mb.", file=sys.stderr)
+            return
+        limit = memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def run(config: Dict[str, Any]) -> Dict[str, Any]:
+    """ Trains and evaluates every configured model type.
+    :returns: the score of each model type, or the ZenML run when orchestrated"""
+    results = {}
+    for model_type in config["models"]:
+        params = dict(file_path=config["file_path"], target=config["target"], model_type=model_type,
+                      n_jobs=config["n_jobs"], scale_method=config["scale_method"], n_components=config["n_components"])
+        if config["orchestrated"]:
+            from pipeline.run_pipeline import ml_pipeline
+
+            # ZenML stores the inference pipeline as the "inference_pipeline" artifact of the run.
+            results[model_type] = ml_pipeline(**params)
+        else:
+            save_path = None
+            if config["artifact_dir"] is not None:
+                os.makedirs(config["artifact_dir"], exist_ok=True)
+                save_path = os.path.join(config["artifact_dir"], f"{model_type}_pipeline.joblib")
+            results[model_type] = run_local(save_path=save_path, **params)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    config = parse_args(argv)
+    apply_resource_limits(config["blas_threads"], config["memory_limit_mb"])
+
+    from threadpoolctl import threadpool_limits
+
+    with threadpool_limits(limits=config["blas_threads"]):
+        results = run(config)
+    for model_type, result in results.items():
+        print(f"{model_type}: {result}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
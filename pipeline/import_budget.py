@@ -0,0 +1,71 @@
+"""
+Startup-time regression check for the lazy imports.
+
+Each module is imported in a fresh interpreter under `python -X importtime`; the check fails when an
+import pulls in a module that should only load on demand, or takes longer than its time budget.
+Run from the repository root:
+
+    python pipeline/import_budget.py
+"""
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# module -> (cumulative import budget in milliseconds, modules it must not import)
+IMPORT_BUDGETS: Dict[str, Tuple[float, List[str]]] = {
+    "pipeline.run_pipeline": (150.0, ["zenml", "pandas", "sklearn"]),
+    "pipeline.cli": (150.0, ["zenml", "numpy", "pandas", "sklearn"]),
+    "src.ingest_data": (150.0, ["pandas", "sklearn"]),
+    "src.impute_data": (150.0, ["pandas", "sklearn"]),
+    "src.data_splitter": (150.0, ["pandas", "sklearn"]),
+    "src.model_evaluator": (150.0, ["pandas", "sklearn"]),
+    "src.model_building": (150.0, ["pandas", "sklearn"]),
+    # FeatureEngineer subclasses sklearn.base classes, which load scipy and pandas; almost all of the
+    # budget is that import. The scalers and PCA must still wait until fit().
+    "src.feature_engineering": (2000.0, ["sklearn.decomposition", "sklearn.preprocessing"]),
+}
+
+
+def import_times(module: str) -> Dict[str, float]:
+    """ Imports a module in a new interpreter.
+    :param module: dotted module name
+    :returns: cumulative import time in milliseconds of every module that got imported"""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise ImportError(f"Importing {module} failed:\n{result.stderr}")
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def check_import_budgets(budgets: Dict[str, Tuple[float, List[str]]] = IMPORT_BUDGETS) -> List[str]:
+    """:returns: a description of every budget violation, empty when all modules are within budget."""
+    violations = []
+    for module, (budget_ms, forbidden) in budgets.items():
+        times = import_times(module)
+        elapsed = times.get(module, 0.0)
+        if elapsed > budget_ms:
+            violations.append(f"{module}: import took {elapsed:.1f} ms, budget is {budget_ms:.1f} ms")
+        for name in forbidden:
+            if name in times:
+                violations.append(f"{module}: eagerly imports {name}")
+    return violations
+
+
+if __name__ == "__main__":
+    problems = check_import_budgets()
+    for problem in problems:
+        print(problem)
+    if problems:
+        sys.exit(1)
+    print("All imports are within budget.")
@@ -1,48 +1,130 @@
-from steps.data_injector_step import data_imputation_step
-from steps.data_ingestion_step import data_ingestion_step
-from steps.data_splitter_step import data_splitter_step
-from steps.model_builder_step import model_builder_step
-from steps.model_evaluator_step import model_evaluator
-from sklearn.linear_model import LinearRegression
+"""
+zenml and the step modules are only imported when the orchestrated pipeline is first accessed
+(ml_pipeline below), so importing this module or using run_local() never pays for them.
+"""
+import os
+from typing import Optional
 
-from zenml import Model, pipeline
-from zenml import logger
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Resolved against the repository so the default works whatever the working directory is.
+DEFAULT_FILE_PATH = os.path.join(REPO_ROOT, "data", "wine.zip")
+DEFAULT_TARGET = "Class"
+DEFAULT_MODEL_TYPE = "linear_regression"
+DEFAULT_SCALE_METHOD = "standard"
 
-logger.get_logger(__name__)
 
-"""
-The Feature Engineering Step Was Not Implemented In This Project
-"""
+def _build_pipeline():
+    """Defines the ZenML pipeline; this is the only place zenml gets imported."""
+    from steps.data_injector_step import data_imputation_step
+    from steps.data_ingestion_step import data_ingestion_step
+    from steps.data_splitter_step import data_splitter_step
+    from steps.feature_engineering_step import feature_engineering_step
+    from steps.inference_pipeline_step import inference_pipeline_step
+    from steps.model_builder_step import model_builder_step
+    from steps.model_evaluator_step import model_evaluator
+
+    from zenml import Model, pipeline
+    from zenml import logger
+
+    logger.get_logger(__name__)
+
+    # Define the model configuration
+    model_config = Model(
+        name="data_pipeline_model",
+        license="Apache-2.0",
+        description="Model for handling data ingestion, imputation, and splitting.",
+        version = "v0.1",
+        limitations = None
+    )
+
+    @pipeline(model=model_config, name="data_pipeline")
+    def ml_pipeline(file_path: str = DEFAULT_FILE_PATH, target: str = DEFAULT_TARGET,
+                    model_type: str = DEFAULT_MODEL_TYPE, n_jobs: Optional[int] = -1,
+                    scale_method: Optional[str] = DEFAULT_SCALE_METHOD, n_components: Optional[int] = None):
+        """
+        ZenML pipeline for data ingestion, imputation, and splitting.
+        """
+        # Step 1: Ingest data from a zip file
+        df = data_ingestion_step(file_path=file_path)
+
+        # Step 2: Impute and clean data
+        df_cleaned, imputer = data_imputation_step(df=df)
+
+        # Step 3: Split data into training and testing sets
+        train_df, test_df = data_splitter_step(df=df_cleaned)
+
+        # Step 4: Scaling and projecting the training features
+        train_features, feature_engineer = feature_engineering_step(
+            train_df=train_df, target=target, scale_method=scale_method, n_components=n_components)
+
+        # Step 5: Building and returning the Classifier model
+        trained_model = model_builder_step(train_df=train_features, target=target, model_type=model_type, n_jobs=n_jobs)
+
+        # Step 6: Bundling the fitted imputer, feature engineer and model for inference
+        inference_pipeline = inference_pipeline_step(
+            imputer=imputer, feature_engineer=feature_engineer, model=trained_model, train_df=train_df, target=target)
 
-# Define the model configuration
-model_config = Model(
-    name="data_pipeline_model",
-    license="Apache-2.0",
-    description="Model for handling data ingestion, imputation, and splitting.",
-    version = "v0.1",
-    limitations = None
-)
-
-@pipeline(model=model_config, name="data_pipeline")
-def ml_pipeline():
+        # Step 7: Evaluating the inference pipeline on the raw test set
+        report =  model_evaluator(inference_pipeline, test_df, target=target)
+        return report
+
+    return ml_pipeline
+
+
+def __getattr__(name: str):
+    # Module level lazy attribute (PEP 562): `from pipeline.run_pipeline import ml_pipeline` still works,
+    # and the built pipeline is cached so ZenML always resolves the same object.
+    if name == "ml_pipeline":
+        globals()["ml_pipeline"] = _build_pipeline()
+        return globals()["ml_pipeline"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def run_local(file_path: str = DEFAULT_FILE_PATH, target: str = DEFAULT_TARGET,
+              model_type: str = DEFAULT_MODEL_TYPE, n_jobs: Optional[int] = -1,
+              scale_method: Optional[str] = DEFAULT_SCALE_METHOD, n_components: Optional[int] = None,
+              save_path: Optional[str] = None) -> float:
     """
-    ZenML pipeline for data ingestion, imputation, and splitting.
+    Runs the same steps as ml_pipeline in-process, without zenml.
+
+    Args:
+        file_path: The path to the zip file to be ingested.
+        target: The name of the target column.
+        model_type: The type of model to build ('random_forest', 'svc', 'linear_regression', 'logistic_regression', 'stacking', 'voting').
+        n_jobs: Worker threads for estimators that support it; -1 uses every core.
+        scale_method: Scaler of the FeatureEngineer ('standard', 'robust' or None).
+        n_components: Principal components kept by the FeatureEngineer, None keeps all of them.
+        save_path: Where to write the fitted InferencePipeline with joblib, None to skip saving.
+
+    Returns:
+        The score of the inference pipeline on the test set.
     """
-    # Step 1: Ingest data from a zip file
-    df = data_ingestion_step(file_path="../data/wine.zip")
-
-    # Step 2: Impute and clean data
-    df_cleaned = data_imputation_step(df=df)
-
-    # Step 3: Split data into training and testing sets
-    train_df, test_df = data_splitter_step(df=df_cleaned)
-    
-    # Step 4: Building and returning the Classifier model
-    trained_model = model_builder_step(train_df=train_df, target="Class", model_type="linear_regression")
-    
-    # Step 5: Evaluating model performance
-    report =  model_evaluator(trained_model, test_df, target= "Class")
-    return report
-    
+    from sklearn.model_selection import train_test_split
+
+    from src.feature_engineering import FeatureEngineer
+    from src.impute_data import DataInjector
+    from src.inference_pipeline import InferencePipeline
+    from src.ingest_data import DataIngestor
+    from src.model_building import ModelSelector
+    from src.model_evaluator import ModelEvaluator
+
+    df = DataIngestor.get_data_ingestion(file_path).ingest_data(file_path)
+    data_injector = DataInjector()
+    df_cleaned = data_injector.drop_duplicated(data_injector.handle_missing_values(df))
+    train_df, test_df = train_test_split(df_cleaned, test_size=0.3, random_state=42)
+
+    X_train = train_df.drop(columns=[target])
+    feature_engineer = FeatureEngineer(scale_method=scale_method, n_components=n_components).fit(X_train)
+    train_features = feature_engineer.transform(X_train)
+    train_features[target] = train_df[target]
+
+    model = ModelSelector.get_model_builder(model_type, train_df=train_features, target=target, n_jobs=n_jobs).build()
+    inference_pipeline = InferencePipeline(data_injector, feature_engineer, model, list(X_train.columns))
+    if save_path is not None:
+        inference_pipeline.save(save_path)
+    return ModelEvaluator().evaluate_model(inference_pipeline, test_df, target)
+
+
 if __name__ == "__main__":
-    ml_pipeline()
\ No newline at end of file
+    ml_pipeline = _build_pipeline()
+    ml_pipeline()
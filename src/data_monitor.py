@@ -0,0 +1,378 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from copy import deepcopy
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (KLL). Memory is O(k log(n/k)) regardless of how many values are seen."""
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        """
+        Args:
+            k: Accuracy parameter, the rank error is roughly 1.7 / k.
+            seed: Seed of the random offsets used when compacting.
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.n = 0
+        self.compactors = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self) -> None:
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.compactors)):
+                if len(self.compactors[level]) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                items = np.sort(self.compactors[level])
+                # An odd item out stays behind so that the total weight is preserved exactly.
+                leftover = items[len(items) - len(items) % 2:]
+                items = items[:len(items) - len(items) % 2]
+                promoted = items[self._rng.integers(2)::2]
+                self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], promoted])
+                self.compactors[level] = leftover
+                compacted = True
+
+    def update(self, values: np.ndarray) -> None:
+        """ Adds a batch of values, NaNs are ignored.
+        :param values: 1-d array of numbers"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self.n += len(values)
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """ Folds another sketch into this one, the result summarises both streams.
+        :param other: KLLSketch built with the same k"""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.n += other.n
+        self._compress()
+
+    def _weighted_items(self):
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(c), 2 ** level) for level, c in enumerate(self.compactors)])
+        order = np.argsort(items, kind="mergesort")
+        return items[order], weights[order]
+
+    def cdf(self, points: np.ndarray) -> np.ndarray:
+        """:returns: the estimated fraction of values <= each point."""
+        items, weights = self._weighted_items()
+        if not len(items):
+            return np.full(len(np.atleast_1d(points)), np.nan)
+        cumulative = np.concatenate([[0], np.cumsum(weights)])
+        return cumulative[np.searchsorted(items, points, side="right")] / cumulative[-1]
+
+    def quantile(self, q) -> np.ndarray:
+        """:returns: the estimated value at each quantile q in [0, 1]."""
+        items, weights = self._weighted_items()
+        if not len(items):
+            return np.full(len(np.atleast_1d(q)), np.nan)
+        cumulative = np.cumsum(weights) / weights.sum()
+        idx = np.searchsorted(cumulative, np.atleast_1d(q), side="left")
+        return items[np.minimum(idx, len(items) - 1)]
+
+
+class FeatureSketch(ABC):
+    """Constant-memory summary of one column, updated batch by batch and mergeable across workers."""
+    def __init__(self):
+        self.count = 0
+        self.null_count = 0
+
+    @property
+    def null_rate(self) -> float:
+        return self.null_count / self.count if self.count else float("nan")
+
+    @abstractmethod
+    def update(self, series: pd.Series) -> None:
+        """ Adds a batch of values to the sketch. """
+        pass
+
+    @abstractmethod
+    def merge(self, other: "FeatureSketch") -> None:
+        """ Folds a sketch of the same type into this one. """
+        pass
+
+    @abstractmethod
+    def drift(self, series: pd.Series) -> Dict[str, float]:
+        """ Compares a new batch against this sketch, which is used as the reference.
+        :returns: dict with the PSI and KS scores of the batch"""
+        pass
+
+    @abstractmethod
+    def summary(self) -> Dict[str, float]:
+        """ Returns the summary statistics kept by the sketch. """
+        pass
+
+
+def population_stability_index(expected: np.ndarray, actual: np.ndarray, eps: float = 1e-4) -> float:
+    """ PSI between two binned distributions; < 0.1 is stable, > 0.2 is a significant shift.
+    :param expected: reference bin proportions
+    :param actual: batch bin proportions
+    :param eps: floor applied to empty bins
+    :returns: the PSI score"""
+    expected = np.clip(expected, eps, None)
+    actual = np.clip(actual, eps, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+class NumericalFeatureSketch(FeatureSketch):
+    """Counts, nulls, Welford moments, min/max and a KLL quantile sketch of a numeric column."""
+    def __init__(self, k: int = 200, n_bins: int = 10, seed: Optional[int] = None):
+        super().__init__()
+        self.n_bins = n_bins
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("nan")
+        self.max = float("nan")
+        self.quantiles = KLLSketch(k=k, seed=seed)
+        self._bin_edges = None
+
+    @property
+    def n_valid(self) -> int:
+        return self.count - self.null_count
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n_valid - 1) if self.n_valid > 1 else float("nan")
+
+    def _combine(self, n: int, mean: float, m2: float, minimum: float, maximum: float) -> None:
+        # Chan et al. parallel form of Welford's update, combining two partial moment summaries.
+        total = self.n_valid + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.n_valid * n / total
+        self.min = minimum if np.isnan(self.min) else min(self.min, minimum)
+        self.max = maximum if np.isnan(self.max) else max(self.max, maximum)
+
+    def update(self, series: pd.Series) -> None:
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        valid = values[~np.isnan(values)]
+        if len(valid):
+            batch_mean = valid.mean()
+            self._combine(len(valid), batch_mean, float(((valid - batch_mean) ** 2).sum()), valid.min(), valid.max())
+        self.count += len(values)
+        self.null_count += len(values) - len(valid)
+        self.quantiles.update(valid)
+        self._bin_edges = None
+
+    def merge(self, other: "NumericalFeatureSketch") -> None:
+        if other.n_valid:
+            self._combine(other.n_valid, other.mean, other.m2, other.min, other.max)
+        self.count += other.count
+        self.null_count += other.null_count
+        self.quantiles.merge(other.quantiles)
+        self._bin_edges = None
+
+    def bin_edges(self) -> np.ndarray:
+        """:returns: the inner PSI bin edges, taken at the reference quantiles and cached until the next update."""
+        if self._bin_edges is None:
+            inner = np.linspace(0, 1, self.n_bins + 1)[1:-1]
+            self._bin_edges = np.unique(self.quantiles.quantile(inner))
+        return self._bin_edges
+
+    def drift(self, series: pd.Series) -> Dict[str, float]:
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        values = np.sort(values[~np.isnan(values)])
+        if not len(values) or not self.quantiles.n:
+            return {"psi": float("nan"), "ks": float("nan")}
+
+        # Bin i holds edges[i-1] < x <= edges[i], matching cdf() which counts values <= x.
+        edges = self.bin_edges()
+        expected = np.diff(np.concatenate([[0.0], self.quantiles.cdf(edges), [1.0]]))
+        actual = np.bincount(np.searchsorted(edges, values, side="left"), minlength=len(edges) + 1) / len(values)
+        psi = population_stability_index(expected, actual)
+
+        # Both CDFs only step at batch values or retained sketch items, so checking those points finds the maximum.
+        points = np.unique(np.concatenate([values, np.concatenate(self.quantiles.compactors)]))
+        batch_cdf = np.searchsorted(values, points, side="right") / len(values)
+        ks = float(np.max(np.abs(batch_cdf - self.quantiles.cdf(points))))
+        return {"psi": psi, "ks": ks}
+
+    def summary(self) -> Dict[str, float]:
+        p25, p50, p75 = self.quantiles.quantile([0.25, 0.5, 0.75])
+        return {
+            "count": self.count,
+            "null_rate": self.null_rate,
+            "mean": self.mean if self.n_valid else float("nan"),
+            "std": float(np.sqrt(self.variance)),
+            "min": self.min,
+            "25%": p25,
+            "50%": p50,
+            "75%": p75,
+            "max": self.max,
+        }
+
+
+class CategoricalFeatureSketch(FeatureSketch):
+    """Counts, nulls and category frequencies of a non-numeric column."""
+    OTHER = "__other__"
+
+    def __init__(self, max_categories: int = 100):
+        """
+        Args:
+            max_categories: Categories tracked individually; any further ones are pooled under OTHER.
+        """
+        super().__init__()
+        self.max_categories = max_categories
+        self.frequencies = Counter()
+
+    def _add(self, counts: Dict) -> None:
+        for category, n in counts.items():
+            if category in self.frequencies or len(self.frequencies) < self.max_categories:
+                self.frequencies[category] += n
+            else:
+                self.frequencies[self.OTHER] += n
+
+    def update(self, series: pd.Series) -> None:
+        self.count += len(series)
+        self.null_count += int(series.isnull().sum())
+        self._add(series.dropna().astype(str).value_counts().to_dict())
+
+    def merge(self, other: "CategoricalFeatureSketch") -> None:
+        self.count += other.count
+        self.null_count += other.null_count
+        self._add(other.frequencies)
+
+    def drift(self, series: pd.Series) -> Dict[str, float]:
+        batch = series.dropna().astype(str).value_counts()
+        total = sum(self.frequencies.values())
+        if batch.empty or not total:
+            return {"psi": float("nan"), "ks": float("nan")}
+        categories = list(self.frequencies)
+        unseen = batch[~batch.index.isin(categories)].sum()
+        if self.OTHER not in self.frequencies:
+            categories.append(self.OTHER)
+        expected = np.array([self.frequencies.get(c, 0) for c in categories], dtype=float) / total
+        actual = batch.reindex(categories, fill_value=0).to_numpy(dtype=float)
+        actual[categories.index(self.OTHER)] += unseen
+        psi = population_stability_index(expected, actual / batch.sum())
+        # KS is undefined without an ordering of the categories.
+        return {"psi": psi, "ks": float("nan")}
+
+    def summary(self) -> Dict[str, float]:
+        return {"count": self.count, "null_rate": self.null_rate, "unique": len(self.frequencies)}
+
+
+class DataQualityMonitor:
+    """Keeps per-feature sketches of the training data and scores incoming batches for drift in O(batch)."""
+    def __init__(self, k: int = 200, n_bins: int = 10, max_categories: int = 100,
+                 psi_threshold: float = 0.2, ks_threshold: float = 0.2, seed: Optional[int] = 42):
+        """
+        Args:
+            k: Accuracy parameter of the quantile sketches.
+            n_bins: Number of reference quantile bins used for PSI.
+            max_categories: Categories tracked per non-numeric column.
+            psi_threshold: PSI above which a feature is flagged as drifted.
+            ks_threshold: KS statistic above which a feature is flagged as drifted.
+            seed: Seed of the quantile sketches.
+        """
+        self.k = k
+        self.n_bins = n_bins
+        self.max_categories = max_categories
+        self.psi_threshold = psi_threshold
+        self.ks_threshold = ks_threshold
+        self.seed = seed
+        self.reference: Dict[str, FeatureSketch] = {}
+        self.current: Dict[str, FeatureSketch] = {}
+
+    def _new_sketch(self, series: pd.Series) -> FeatureSketch:
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            return NumericalFeatureSketch(k=self.k, n_bins=self.n_bins, seed=self.seed)
+        return CategoricalFeatureSketch(max_categories=self.max_categories)
+
+    def _update(self, sketches: Dict[str, FeatureSketch], df: pd.DataFrame) -> None:
+        for column in df.columns:
+            if column not in sketches:
+                sketches[column] = self._new_sketch(df[column])
+            sketches[column].update(df[column])
+
+    def update_reference(self, df: pd.DataFrame) -> "DataQualityMonitor":
+        """ Adds a chunk of training data to the reference, so large training sets can be streamed in.
+        :param df: pandas.DataFrame chunk of the training data
+        :returns: self"""
+        self._update(self.reference, df)
+        return self
+
+    def evaluate(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """ Scores a batch against the reference without touching any stored history.
+        :param batch: pandas.DataFrame of new data
+        :returns: a dataframe with one row per reference feature with the null rates, PSI, KS and drift flag"""
+        if not self.reference:
+            raise ValueError("The reference is empty; call update_reference() with the training data first.")
+        rows = {}
+        for column, sketch in self.reference.items():
+            if column not in batch.columns:
+                rows[column] = {"reference_null_rate": sketch.null_rate, "batch_null_rate": float("nan"),
+                                "psi": float("nan"), "ks": float("nan"), "missing_column": True}
+                continue
+            series = batch[column]
+            scores = sketch.drift(series)
+            rows[column] = {"reference_null_rate": sketch.null_rate,
+                            "batch_null_rate": series.isnull().mean() if len(series) else float("nan"),
+                            "psi": scores["psi"], "ks": scores["ks"], "missing_column": False}
+        report = pd.DataFrame.from_dict(rows, orient="index")
+        report["drifted"] = report["missing_column"] | (report["psi"] > self.psi_threshold) | (report["ks"] > self.ks_threshold)
+        return report
+
+    def observe(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """ Evaluates a batch and folds it into the running sketches of the served data.
+        :param batch: pandas.DataFrame of new data
+        :returns: the drift report of the batch, see evaluate()"""
+        report = self.evaluate(batch)
+        self._update(self.current, batch)
+        return report
+
+    def merge(self, other: "DataQualityMonitor") -> None:
+        """ Folds the sketches of a monitor fed by another worker into this one. """
+        pairs = ((self.reference, other.reference), (self.current, other.current))
+        # Check every column before merging any, so a mismatch leaves this monitor untouched.
+        for mine, theirs in pairs:
+            for column, sketch in theirs.items():
+                if column in mine and type(mine[column]) is not type(sketch):
+                    raise ValueError(f"Cannot merge column {column!r}: sketched as {type(mine[column]).__name__} "
+                                     f"here and as {type(sketch).__name__} in the other monitor.")
+        for mine, theirs in pairs:
+            for column, sketch in theirs.items():
+                if column in mine:
+                    mine[column].merge(sketch)
+                else:
+                    mine[column] = deepcopy(sketch)
+
+    def summary(self, which: str = "reference") -> pd.DataFrame:
+        """:param which: 'reference' or 'current'
+        :returns: the statistics of every sketched feature, one row per feature"""
+        if which not in ("reference", "current"):
+            raise ValueError(f"Unknown sketch set: {which}")
+        sketches = self.reference if which == "reference" else self.current
+        return pd.DataFrame.from_dict({c: s.summary() for c, s in sketches.items()}, orient="index")
+
+
+# Use Case
+if __name__ == "__main__":
+    wine_df = pd.read_csv("../extracted_data/wine.csv")
+    reference_df = wine_df.sample(frac=0.7, random_state=42)
+    monitor = DataQualityMonitor()
+    for start in range(0, len(reference_df), 40):
+        monitor.update_reference(reference_df.iloc[start:start + 40])
+    print(monitor.summary().to_string())
+
+    shifted = wine_df.drop(reference_df.index)
+    shifted["Alcohol"] += 1.5
+    print(monitor.observe(shifted).to_string())
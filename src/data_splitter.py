@@ -1,8 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Tuple
 
-import pandas as pd
-from sklearn.model_selection import train_test_split
-from typing import Tuple
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataSplitter(ABC):
@@ -20,6 +22,8 @@ class TrainTestSplitter(DataSplitter):
         :param target: target column
         :return: X_train, X_test, y_train, y_test
         """
+        from sklearn.model_selection import train_test_split
+
         X = df.drop(columns=[target])
         y = df[target]
         # Splitting into training and test sets.
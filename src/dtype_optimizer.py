@@ -0,0 +1,104 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class SchemaOptimizer(ABC):
+    @abstractmethod
+    def optimize(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """ Converts the columns of a dataframe to more compact dtypes.
+        :returns: the optimized dataframe and a per-column memory report"""
+        pass
+
+
+class DtypeOptimizer(SchemaOptimizer):
+    """Downcasts numeric columns to the smallest safe dtype and low-cardinality strings to category."""
+    def __init__(self, float_rtol: float = 0.0, max_category_ratio: float = 0.5):
+        """
+        Args:
+            float_rtol: Largest relative error accepted when casting float64 to float32. The default 0 only
+                casts columns where the shortest decimal repr of every float32 value reads back as the original
+                float64, so decimals like 14.23 are cast while large IDs or timestamps, which need more than the
+                ~7 significant digits of float32, are kept. Any positive value opts into lossy casts instead.
+            max_category_ratio: Object columns with at most this share of unique values become category.
+        """
+        self.float_rtol = float_rtol
+        self.max_category_ratio = max_category_ratio
+
+    @staticmethod
+    def _decimal_round_trips(values: np.ndarray) -> bool:
+        """:returns: whether every value prints the same as float32, i.e. str(float32(v)) parses back to v."""
+        # Checking the unique values keeps this cheap for repeated values; unsafe columns fail on the first mismatch.
+        return all(float(str(np.float32(value))) == value for value in np.unique(values[np.isfinite(values)]))
+
+    def _optimize_float(self, series: pd.Series) -> pd.Series:
+        if series.dtype != np.float64:
+            return series
+        values = series.to_numpy()
+        finite = values[np.isfinite(values)]
+        if len(finite) and np.abs(finite).max() > np.finfo(np.float32).max:
+            return series
+        downcast = series.astype(np.float32)
+        if self.float_rtol == 0:
+            lossless = self._decimal_round_trips(values)
+        else:
+            widened = downcast.to_numpy(dtype=np.float64)
+            lossless = np.allclose(widened, values, rtol=self.float_rtol, atol=0, equal_nan=True)
+        return downcast if lossless else series
+
+    @staticmethod
+    def _optimize_integer(series: pd.Series) -> pd.Series:
+        if series.empty:
+            return series
+        downcast = "unsigned" if series.min() >= 0 else "integer"
+        return pd.to_numeric(series, downcast=downcast)
+
+    def _optimize_object(self, series: pd.Series) -> pd.Series:
+        if series.empty:
+            return series
+        if series.nunique(dropna=True) / len(series) <= self.max_category_ratio:
+            return series.astype("category")
+        return series
+
+    def optimize_column(self, series: pd.Series) -> pd.Series:
+        """:returns: the column in its most compact safe dtype, or unchanged when none applies."""
+        if pd.api.types.is_bool_dtype(series):
+            return series
+        if pd.api.types.is_float_dtype(series):
+            return self._optimize_float(series)
+        if pd.api.types.is_integer_dtype(series) and isinstance(series.dtype, np.dtype):
+            return self._optimize_integer(series)
+        if series.dtype == object or pd.api.types.is_string_dtype(series):
+            return self._optimize_object(series)
+        return series
+
+    def optimize(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """ Optimizes every column of the dataframe.
+        :param df: pandas.DataFrame to optimize
+        :returns: the optimized dataframe and a report with the dtype and memory of every column before and after"""
+        optimized = df.copy()
+        rows = {}
+        for column in df.columns:
+            optimized[column] = self.optimize_column(df[column])
+            before = int(df[column].memory_usage(index=False, deep=True))
+            after = int(optimized[column].memory_usage(index=False, deep=True))
+            rows[column] = {
+                "original_dtype": str(df[column].dtype),
+                "optimized_dtype": str(optimized[column].dtype),
+                "original_bytes": before,
+                "optimized_bytes": after,
+                "saved_bytes": before - after,
+                "saved_percent": 100 * (before - after) / before if before else 0.0,
+            }
+        return optimized, pd.DataFrame.from_dict(rows, orient="index")
+
+
+# Use Case
+if __name__ == "__main__":
+    wine_df = pd.read_csv("../extracted_data/wine.csv")
+    wine_df["Grade"] = np.where(wine_df["Class"] == 1, "premium", "standard")
+    optimized_df, memory_report = DtypeOptimizer().optimize(wine_df)
+    print(memory_report.to_string())
+    print(f"Total: {memory_report['original_bytes'].sum()} -> {memory_report['optimized_bytes'].sum()} bytes")
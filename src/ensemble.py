@@ -0,0 +1,109 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import BaseEstimator, ClassifierMixin
+
+
+def fit_base_model(builder_cls, train_df: pd.DataFrame, target: str, rows: Optional[np.ndarray] = None) -> BaseEstimator:
+    """ Builds one base model, on a subset of the rows when given; module level so it can run in a worker process.
+    :param builder_cls: a ModelBuilder subclass
+    :param train_df: The training DataFrame.
+    :param target: The name of the target column.
+    :param rows: positional indices of the rows to fit on, None for all of them
+    :returns: the fitted estimator"""
+    df = train_df if rows is None else train_df.iloc[rows]
+    # The ensemble parallelises across models, so each model gets a single thread.
+    return builder_cls(train_df=df, target=target, n_jobs=1).build()
+
+
+def fit_base_models(builder_classes: Sequence, train_df: pd.DataFrame, target: str,
+                    folds: Sequence = (), n_jobs: Optional[int] = -1):
+    """ Fits every base model on the full data and on the training part of every fold, all in parallel.
+    :param builder_classes: ModelBuilder subclasses
+    :param train_df: The training DataFrame.
+    :param target: The name of the target column.
+    :param folds: (train rows, validation rows) pairs
+    :param n_jobs: worker processes
+    :returns: the full-data models, and per builder the list of models fitted on each fold"""
+    tasks = [(cls, None) for cls in builder_classes]
+    tasks += [(cls, train_rows) for cls in builder_classes for train_rows, _ in folds]
+    fitted = Parallel(n_jobs=n_jobs)(
+        delayed(fit_base_model)(cls, train_df, target, rows) for cls, rows in tasks
+    )
+    n_models = len(builder_classes)
+    fold_models = [fitted[n_models + i * len(folds): n_models + (i + 1) * len(folds)] for i in range(n_models)]
+    return fitted[:n_models], fold_models
+
+
+def meta_features(model: BaseEstimator, X: pd.DataFrame) -> np.ndarray:
+    """:returns: the class probabilities of the model, or its decision function / predictions as a 2-d array."""
+    if hasattr(model, "predict_proba"):
+        output = model.predict_proba(X)
+    elif hasattr(model, "decision_function"):
+        output = model.decision_function(X)
+    else:
+        output = model.predict(X)
+    output = np.asarray(output, dtype=float)
+    return output.reshape(len(X), -1)
+
+
+class StackingEnsemble(ClassifierMixin, BaseEstimator):
+    """Base models whose outputs are combined by a meta-learner; returned by StackingBuilder."""
+    def __init__(self, base_models: List[BaseEstimator], meta_model: BaseEstimator, n_jobs: Optional[int] = -1):
+        """
+        Args:
+            base_models: Fitted base estimators.
+            meta_model: Meta-learner fitted on the out-of-fold outputs of the base models.
+            n_jobs: Threads used to query the base models concurrently.
+        """
+        self.base_models = base_models
+        self.meta_model = meta_model
+        self.n_jobs = n_jobs
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return self.meta_model.classes_
+
+    def transform_meta(self, X: pd.DataFrame) -> np.ndarray:
+        """:returns: the base model outputs for X side by side, computed concurrently."""
+        # Threads avoid pickling the models on every call; sklearn releases the GIL in the heavy parts.
+        outputs = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(meta_features)(model, X) for model in self.base_models
+        )
+        return np.hstack(outputs)
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        return self.meta_model.predict(self.transform_meta(X))
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        return self.meta_model.predict_proba(self.transform_meta(X))
+
+
+class VotingEnsemble(ClassifierMixin, BaseEstimator):
+    """Hard majority vote over base classifiers; returned by VotingBuilder."""
+    def __init__(self, base_models: List[BaseEstimator], n_jobs: Optional[int] = -1):
+        """
+        Args:
+            base_models: Fitted base classifiers.
+            n_jobs: Threads used to query the base models concurrently.
+        """
+        self.base_models = base_models
+        self.n_jobs = n_jobs
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return np.unique(np.concatenate([model.classes_ for model in self.base_models]))
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        predictions = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(model.predict)(X) for model in self.base_models
+        )
+        classes = self.classes_
+        rows = np.arange(len(predictions[0]))
+        counts = np.zeros((len(rows), len(classes)), dtype=np.intp)
+        for prediction in predictions:
+            counts[rows, np.searchsorted(classes, prediction)] += 1
+        # argmax takes the first maximum, so a tie goes to the smallest tied label.
+        return classes[counts.argmax(axis=1)]
@@ -1,8 +1,13 @@
-import pandas as pd
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 import warnings
 warnings.filterwarnings("ignore")
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class Injector(ABC):
     @abstractmethod
     def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -15,26 +20,74 @@ class Injector(ABC):
         """ Drops duplicated rows. """
         pass
 
+    @abstractmethod
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """ Applies the statistics learned by handle_missing_values to new data. """
+        pass
+
 class DataInjector(Injector):
+    def __init__(self):
+        # Learned by handle_missing_values and reused by transform at inference time.
+        self.dropped_columns_ = []
+        self.fill_values_ = {}
+        self.dtypes_ = {}
+
     def handle_missing_values(self,df: pd.DataFrame) -> pd.DataFrame:
-        """ Performs missing value imputation on dataframe.
+        """ Performs missing value imputation on dataframe and keeps the fill values for transform().
         :param df: pandas.DataFrame to be imputed.
        :returns: a dataframe with missing values imputed using median or mode imputation.
         """
+        import pandas as pd
+
+        self.dropped_columns_, self.fill_values_, self.dtypes_ = [], {}, {}
         for column in df.columns:
             null_sum = df[column].isnull().sum()
             null_percent = null_sum / len(df)
             # Drop columns with 75% missing values
             if null_percent > 0.75:
                 df.drop([column], axis=1, inplace=True)
+                self.dropped_columns_.append(column)
+                continue
+            # Impute NaN values with either mode or median values.
+            """ Using mode fill for categorical columns is to handle multi-class columns.
+            The fill value is learned for every column, new data may have gaps where the training data had none. """
+            series = df[column]
+            if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+                fill_value = series.mode()[0]
+            elif pd.api.types.is_integer_dtype(series):
+                fill_value = round(series.median())
             else:
-                # Impute NaN values with either mode or mean values.
-                """ Using mode fill for categorical columns is to handle multi-class columns """
-                if df[column].dtype.name  == "object" or df[column].dtype.name == "category":
-                    df[column].fillna(df[column].mode()[0], inplace = True)
-                elif df[column].dtype.name  == "float64" or df[column].dtype.name == "int64":
-                    df[column].fillna(df[column].median(), inplace = True)
+                fill_value = series.median()
+            self.fill_values_[column] = fill_value
+            self.dtypes_[column] = series.dtype
+            if null_sum:
+                # Assigning the filled column back keeps compact dtypes (float32, uint8, category) intact.
+                df[column] = series.fillna(fill_value).astype(series.dtype)
         return df
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """ Imputes new data with the fill values and dtypes learned by handle_missing_values.
+        :param df: pandas.DataFrame with (at least) the columns kept at training time.
+        :returns: a new dataframe restricted to the kept columns, numeric ones as float64, imputed.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not self.dtypes_:
+            raise ValueError("DataInjector is not fitted; call handle_missing_values() on the training data first.")
+        columns = [column for column in self.dtypes_ if column in df.columns]
+        # The training dtypes may be downcast to the training value range (uint8, uint16, ...), and new values
+        # outside it would wrap around silently, so numeric columns are widened to float64 instead.
+        dtypes = {}
+        for column in columns:
+            dtype = self.dtypes_[column]
+            numeric = pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            dtypes[column] = np.float64 if numeric else dtype
+        # Categories unseen at training time only become NaN through the cast, so category columns are cast
+        # before filling; the rest are filled first, as dtypes without NA (bool) would turn NaN into True.
+        categorical = {c: dtype for c, dtype in dtypes.items() if isinstance(dtype, pd.CategoricalDtype)}
+        filled = df[columns].astype(categorical).fillna({c: self.fill_values_[c] for c in columns})
+        return filled.astype({c: dtype for c, dtype in dtypes.items() if c not in categorical})
             
     def drop_duplicated(self, df: pd.DataFrame) -> pd.DataFrame:
         """
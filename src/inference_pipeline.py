@@ -0,0 +1,114 @@
+from typing import Iterable, Iterator, List, Optional, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator
+
+from src.feature_engineering import FeatureEngineer
+from src.impute_data import DataInjector
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class InferencePipeline:
+    """Fitted imputation, feature engineering and model, applied together to score raw data."""
+    def __init__(self, imputer: DataInjector, feature_engineer: Optional[FeatureEngineer], model: BaseEstimator,
+                 feature_columns: List[str]):
+        """
+        Args:
+            imputer: DataInjector fitted by data_imputation_step.
+            feature_engineer: FeatureEngineer fitted by feature_engineering_step, None if the model uses raw features.
+            model: Estimator trained by model_builder_step.
+            feature_columns: Raw input columns the pipeline expects, in training order.
+        """
+        self.imputer = imputer
+        self.feature_engineer = feature_engineer
+        self.model = model
+        self.feature_columns = list(feature_columns)
+
+    def _as_frame(self, X: Union[pd.DataFrame, np.ndarray]) -> pd.DataFrame:
+        if isinstance(X, pd.DataFrame):
+            missing = [c for c in self.feature_columns if c not in X.columns]
+            if missing:
+                raise ValueError(f"Input is missing the columns: {', '.join(map(str, missing))}")
+            return X[self.feature_columns]
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_columns):
+            raise ValueError(f"Expected a 2-d array with {len(self.feature_columns)} columns, got shape {X.shape}")
+        return pd.DataFrame(X, columns=self.feature_columns)
+
+    def transform(self, X: Union[pd.DataFrame, np.ndarray]) -> pd.DataFrame:
+        """:returns: the model input for X: imputed with the training statistics, then feature engineered."""
+        X = self.imputer.transform(self._as_frame(X))
+        if self.feature_engineer is not None:
+            X = self.feature_engineer.transform(X)
+        return X
+
+    def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """ Scores X in one go; use predict_batch or predict_stream for large inputs. """
+        return np.asarray(self.model.predict(self.transform(X)))
+
+    def score(self, X: Union[pd.DataFrame, np.ndarray], y) -> float:
+        """ Returns the model's default score (accuracy for classifiers, R^2 for regressors) on raw X. """
+        return self.model.score(self.transform(X), y)
+
+    def predict_batch(self, X: Union[pd.DataFrame, np.ndarray], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        """ Scores X chunk by chunk into one preallocated output array, so the intermediate frames of only
+        one chunk are alive at a time.
+        :param X: raw input rows, a DataFrame or a 2-d array in feature_columns order
+        :param chunk_size: rows per chunk
+        :param out: optional array of len(X) to write the predictions into
+        :returns: the predictions, `out` when given"""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        n_rows = len(X)
+        if out is not None and len(out) != n_rows:
+            raise ValueError(f"out has {len(out)} rows, expected {n_rows}")
+        for start in range(0, n_rows, chunk_size):
+            chunk = X.iloc[start:start + chunk_size] if isinstance(X, pd.DataFrame) else X[start:start + chunk_size]
+            predictions = self.predict(chunk)
+            if out is None:
+                out = np.empty(n_rows, dtype=predictions.dtype)
+            out[start:start + len(predictions)] = predictions
+        return out if out is not None else np.empty(0)
+
+    def predict_stream(self, chunks: Iterable[Union[pd.DataFrame, np.ndarray]],
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+        """ Scores an iterable of inputs, e.g. pd.read_csv(path, chunksize=...), without materialising it.
+        Every incoming chunk is scored in pieces of at most chunk_size rows.
+        :param chunks: iterable of DataFrames or 2-d arrays
+        :param chunk_size: maximum rows scored at once
+        :returns: an iterator over the predictions, one array per piece"""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        for chunk in chunks:
+            for start in range(0, len(chunk), chunk_size):
+                piece = chunk.iloc[start:start + chunk_size] if isinstance(chunk, pd.DataFrame) else chunk[start:start + chunk_size]
+                yield self.predict(piece)
+
+    def save(self, path: str) -> None:
+        """ Serializes the fitted pipeline with joblib. """
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path: str) -> "InferencePipeline":
+        """:returns: the InferencePipeline stored at path by save()."""
+        pipeline = joblib.load(path)
+        if not isinstance(pipeline, InferencePipeline):
+            raise TypeError(f"{path} does not contain an InferencePipeline.")
+        return pipeline
+
+
+# Use Case
+if __name__ == "__main__":
+    import sys
+
+    # Run from the repository root: python -m src.inference_pipeline <pipeline.joblib> <data.csv>
+    # The saved object references src.inference_pipeline, not this __main__ module.
+    from src.inference_pipeline import InferencePipeline as SavedPipeline
+
+    inference_pipeline = SavedPipeline.load(sys.argv[1])
+    for batch_predictions in inference_pipeline.predict_stream(pd.read_csv(sys.argv[2], chunksize=DEFAULT_CHUNK_SIZE)):
+        print(batch_predictions)
@@ -1,21 +1,32 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-import pandas as pd
+from typing import TYPE_CHECKING
 import zipfile
 import os
 import warnings
 warnings.filterwarnings('ignore')
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class DataIngestion(ABC):
     @abstractmethod
     def ingest_data(self, file_path: str) -> pd.DataFrame:
         pass
 
 class ZipDataIngestion(DataIngestion):
+    def __init__(self, optimize_dtypes: bool = True):
+        """:param optimize_dtypes: downcast the loaded columns with DtypeOptimizer."""
+        self.optimize_dtypes = optimize_dtypes
+        self.memory_report = None
+
     def ingest_data(self, file_path: str) -> pd.DataFrame:
         """Ingest data from a zip file.
          :param file_path: path to the zip file
          :type file_path: str
-         :return: a dataframe with the data loaded from the CSV file inside the zip.
+         :return: a dataframe with the data loaded from the CSV file inside the zip, in compact dtypes
+          when optimize_dtypes is set (the per-column savings are kept in memory_report).
         """
         if not file_path.endswith(".zip"):
             raise ValueError("This ingestor only supports .zip files.")
@@ -36,19 +47,26 @@ class ZipDataIngestion(DataIngestion):
         if len(csv_files) > 1:
              raise ValueError("Multiple CSV files found; please specify which one to use.")
 
+        import pandas as pd
+
         csv_file_path = os.path.join(extract_dir, csv_files[0])
         df = pd.read_csv(csv_file_path)
+        if self.optimize_dtypes:
+            from src.dtype_optimizer import DtypeOptimizer
+
+            df, self.memory_report = DtypeOptimizer().optimize(df)
         return df
 
 class DataIngestor:
      @staticmethod
-     def get_data_ingestion(file_path: str) -> DataIngestion:
+     def get_data_ingestion(file_path: str, optimize_dtypes: bool = True) -> DataIngestion:
          """:return: The appropriate DataIngestion object for the given file path.
          :param file_path: path to the file
          :type file_path: str
+         :param optimize_dtypes: downcast the loaded columns to compact dtypes
          """
          if file_path.endswith(".zip"):
-             return ZipDataIngestion()
+             return ZipDataIngestion(optimize_dtypes=optimize_dtypes)
          # You could add more handlers here, e.g., for .csv
          # elif file_path.endswith(".csv"):
          #     return CsvDataIngestion()
@@ -62,5 +80,6 @@ if __name__ == '__main__':
         ingestor = DataIngestor.get_data_ingestion(file_path)
         df1 = ingestor.ingest_data(file_path)
         print(df1.head())
+        print(ingestor.memory_report)
     except (ValueError, FileNotFoundError) as e:
         print(f"Error: {e}")
\ No newline at end of file
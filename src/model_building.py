@@ -1,23 +1,28 @@
 # src/model_building.py
+# Estimators are imported inside build() so that only the selected model's sklearn module gets loaded.
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-import pandas as pd
-from sklearn.base import BaseEstimator
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LinearRegression
-from sklearn.svm import SVC
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.base import BaseEstimator
 
 
 class ModelBuilder(ABC):
     """Abstract base class for model builders."""
-    def __init__(self, train_df: pd.DataFrame, target: str):
+    def __init__(self, train_df: pd.DataFrame, target: str, n_jobs: Optional[int] = -1):
         """
         Initializes the ModelBuilder.
         Args:
             train_df: The training DataFrame.
             target: The name of the target column.
+            n_jobs: Worker threads for estimators that support it; -1 uses every core.
         """
         self.train_df = train_df
         self.target = target
+        self.n_jobs = n_jobs
         self.model: BaseEstimator
 
     @abstractmethod
@@ -33,7 +38,9 @@ class RandomForestBuilder(ModelBuilder):
     """Builds a RandomForestClassifier."""
 
     def build(self) -> BaseEstimator:
-        self.model = RandomForestClassifier(n_jobs=-1, random_state=42)
+        from sklearn.ensemble import RandomForestClassifier
+
+        self.model = RandomForestClassifier(n_jobs=self.n_jobs, random_state=42)
         X_train = self.train_df.drop(self.target, axis=1)
         y_train = self.train_df[self.target]
         self.model.fit(X_train, y_train)
@@ -43,6 +50,8 @@ class RandomForestBuilder(ModelBuilder):
 class SVCBuilder(ModelBuilder):
     """Builds an SVC model."""
     def build(self) -> BaseEstimator:
+        from sklearn.svm import SVC
+
         self.model = SVC(random_state=42)
         X_train = self.train_df.drop(self.target, axis=1)
         y_train = self.train_df[self.target]
@@ -53,8 +62,142 @@ class SVCBuilder(ModelBuilder):
 class LinearRegressionBuilder(ModelBuilder):
     """Builds a LinearRegression model."""
     def build(self) -> BaseEstimator:
-        self.model = LinearRegression()
+        from sklearn.linear_model import LinearRegression
+
+        self.model = LinearRegression(n_jobs=self.n_jobs)
+        X_train = self.train_df.drop(self.target, axis=1)
+        y_train = self.train_df[self.target]
+        self.model.fit(X_train, y_train)
+        return self.model
+
+
+class LogisticRegressionBuilder(ModelBuilder):
+    """Builds a LogisticRegression classifier."""
+    def build(self) -> BaseEstimator:
+        from sklearn.linear_model import LogisticRegression
+
+        self.model = LogisticRegression(max_iter=1000)
         X_train = self.train_df.drop(self.target, axis=1)
         y_train = self.train_df[self.target]
         self.model.fit(X_train, y_train)
-        return self.model
\ No newline at end of file
+        return self.model
+
+
+DEFAULT_ENSEMBLE_MODELS = ("random_forest", "svc", "linear_regression")
+DEFAULT_VOTING_MODELS = ("random_forest", "svc", "logistic_regression")
+
+
+class StackingBuilder(ModelBuilder):
+    """Builds a StackingEnsemble: base models fitted in parallel plus a meta-learner trained on their out-of-fold outputs."""
+    def __init__(self, train_df: pd.DataFrame, target: str, n_jobs: Optional[int] = -1,
+                 base_model_types: Sequence[str] = DEFAULT_ENSEMBLE_MODELS, n_folds: int = 5,
+                 meta_model: Optional[BaseEstimator] = None, fold_indices: Optional[List[Tuple]] = None):
+        """
+        Args:
+            base_model_types: Keys of MODEL_BUILDERS used as base models.
+            n_folds: Number of stratified folds for the out-of-fold meta-features.
+            meta_model: Unfitted meta-learner, defaults to LogisticRegression.
+            fold_indices: Fold indices of an earlier build on the same data, reused instead of recomputed.
+        """
+        super().__init__(train_df, target, n_jobs)
+        unknown = [m for m in base_model_types if m not in BASE_MODEL_BUILDERS]
+        if unknown or not base_model_types:
+            raise ValueError(f"Unknown base model types: {unknown or base_model_types}")
+        self.base_model_types = list(base_model_types)
+        self.n_folds = n_folds
+        self.meta_model = meta_model
+        self.fold_indices = fold_indices
+
+    def folds(self) -> List[Tuple]:
+        """:returns: the (train rows, validation rows) pairs, computed once and shared by every base model."""
+        if self.fold_indices is None:
+            from sklearn.model_selection import StratifiedKFold
+
+            splitter = StratifiedKFold(n_splits=self.n_folds, shuffle=True, random_state=42)
+            self.fold_indices = list(splitter.split(self.train_df, self.train_df[self.target]))
+        return self.fold_indices
+
+    def build(self) -> BaseEstimator:
+        import numpy as np
+        from sklearn.base import clone
+        from sklearn.linear_model import LogisticRegression
+
+        from src.ensemble import StackingEnsemble, fit_base_models, meta_features
+
+        X_train = self.train_df.drop(self.target, axis=1)
+        y_train = self.train_df[self.target]
+        folds = self.folds()
+        builders = [BASE_MODEL_BUILDERS[m] for m in self.base_model_types]
+        base_models, fold_models = fit_base_models(builders, self.train_df, self.target, folds, self.n_jobs)
+
+        # Every row gets its meta-features from the fold model that did not see it.
+        blocks = []
+        for models in fold_models:
+            outputs = [meta_features(model, X_train.iloc[val_rows]) for model, (_, val_rows) in zip(models, folds)]
+            block = np.empty((len(X_train), outputs[0].shape[1]))
+            for output, (_, val_rows) in zip(outputs, folds):
+                block[val_rows] = output
+            blocks.append(block)
+
+        meta_model = clone(self.meta_model) if self.meta_model is not None else LogisticRegression(max_iter=1000)
+        meta_model.fit(np.hstack(blocks), y_train)
+        self.model = StackingEnsemble(base_models, meta_model, n_jobs=self.n_jobs)
+        return self.model
+
+
+class VotingBuilder(ModelBuilder):
+    """Builds a VotingEnsemble of base classifiers fitted in parallel."""
+    def __init__(self, train_df: pd.DataFrame, target: str, n_jobs: Optional[int] = -1,
+                 base_model_types: Sequence[str] = DEFAULT_VOTING_MODELS):
+        """
+        Args:
+            base_model_types: Keys of MODEL_BUILDERS for classifiers used as voters; use an odd number,
+                with an even number every split vote is a tie, which goes to the smallest label.
+        """
+        super().__init__(train_df, target, n_jobs)
+        unknown = [m for m in base_model_types if m not in BASE_MODEL_BUILDERS]
+        if unknown or not base_model_types:
+            raise ValueError(f"Unknown base model types: {unknown or base_model_types}")
+        self.base_model_types = list(base_model_types)
+
+    def build(self) -> BaseEstimator:
+        from sklearn.base import is_classifier
+
+        from src.ensemble import VotingEnsemble, fit_base_models
+
+        builders = [BASE_MODEL_BUILDERS[m] for m in self.base_model_types]
+        base_models, _ = fit_base_models(builders, self.train_df, self.target, n_jobs=self.n_jobs)
+        regressors = [m for m, model in zip(self.base_model_types, base_models) if not is_classifier(model)]
+        if regressors:
+            raise ValueError(f"Voting needs classifiers, got: {', '.join(regressors)}")
+        self.model = VotingEnsemble(base_models, n_jobs=self.n_jobs)
+        return self.model
+
+
+BASE_MODEL_BUILDERS = {
+    "random_forest": RandomForestBuilder,
+    "svc": SVCBuilder,
+    "linear_regression": LinearRegressionBuilder,
+    "logistic_regression": LogisticRegressionBuilder,
+}
+
+MODEL_BUILDERS = {
+    **BASE_MODEL_BUILDERS,
+    "stacking": StackingBuilder,
+    "voting": VotingBuilder,
+}
+
+
+class ModelSelector:
+    @staticmethod
+    def get_model_builder(model_type: str, train_df: pd.DataFrame, target: str,
+                          n_jobs: Optional[int] = -1) -> ModelBuilder:
+        """:return: The ModelBuilder registered for the given model type.
+        :param model_type: one of the keys of MODEL_BUILDERS
+        :param train_df: The training DataFrame.
+        :param target: The name of the target column.
+        :param n_jobs: Worker threads for estimators that support it; -1 uses every core.
+        """
+        if model_type not in MODEL_BUILDERS:
+            raise ValueError(f"Unknown model type: {model_type}")
+        return MODEL_BUILDERS[model_type](train_df=train_df, target=target, n_jobs=n_jobs)
@@ -1,10 +1,13 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from pandas.core.interchange.dataframe_protocol import DataFrame
-from sklearn.base import BaseEstimator
-import pandas as pd
 from typing_extensions import Annotated
-from sklearn.metrics import accuracy_score
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.base import BaseEstimator
 
 class ModelEvaluatorTemplate(ABC):
     @abstractmethod
@@ -16,7 +19,7 @@ class ModelEvaluator(ModelEvaluatorTemplate):
     def evaluate_model(self, model: BaseEstimator, test_df:pd.DataFrame, target: str):
         """ This outputs the evaluation metrics of the model
         Args:
-            model: The trained model
+            model: The trained model, or an InferencePipeline scoring the raw test data
             test_df: The test data
             target: The target column
         Returns:
@@ -16,4 +16,8 @@ def data_ingestion_step(file_path: str) -> pd.DataFrame:
 
     # Ingest the data
     df = ingestor.ingest_data(file_path)
+    if getattr(ingestor, "memory_report", None) is not None:
+        report = ingestor.memory_report
+        print(f"Memory usage per column after dtype optimization: \n{report.to_string()}")
+        print(f"Saved {report['saved_bytes'].sum()} of {report['original_bytes'].sum()} bytes")
     return df
\ No newline at end of file
@@ -1,9 +1,14 @@
 import pandas as pd
 from zenml import step
 from src.impute_data import DataInjector # Make sure the path is correct
+from typing import Tuple
+from typing_extensions import Annotated
 
 @step
-def data_imputation_step(df: pd.DataFrame) -> pd.DataFrame:
+def data_imputation_step(df: pd.DataFrame) -> Tuple[
+    Annotated[pd.DataFrame, "cleaned_data"],
+    Annotated[DataInjector, "imputer"]
+]:
     """
     ZenML step for cleaning and imputing data using the DataInjector.
 
@@ -11,10 +16,10 @@ def data_imputation_step(df: pd.DataFrame) -> pd.DataFrame:
         df: The input pandas DataFrame.
 
     Returns:
-        A cleaned and imputed pandas DataFrame.
+        A cleaned and imputed pandas DataFrame, and the fitted DataInjector holding the fill values.
     """
     data_injector = DataInjector()
     df_imputed = data_injector.handle_missing_values(df)
     df_cleaned = data_injector.drop_duplicated(df_imputed)
-    return df_cleaned
+    return df_cleaned, data_injector
 
@@ -1,5 +1,4 @@
 import pandas as pd
-from sklearn.model_selection import train_test_split
 from zenml import step
 from typing import Tuple
 from typing_extensions import Annotated
@@ -18,5 +17,7 @@ def data_splitter_step(df: pd.DataFrame) -> Tuple[
     Returns:
         A tuple containing the training and testing DataFrames.
     """
+    from sklearn.model_selection import train_test_split
+
     train_df, test_df = train_test_split(df, test_size=0.3, random_state=42)
     return train_df, test_df
\ No newline at end of file
@@ -0,0 +1,34 @@
+import pandas as pd
+from zenml import step
+from src.feature_engineering import FeatureEngineer
+from typing import Optional, Tuple
+from typing_extensions import Annotated
+
+
+@step
+def feature_engineering_step(
+    train_df: pd.DataFrame,
+    target: str,
+    scale_method: Optional[str] = "standard",
+    n_components: Optional[int] = None,
+) -> Tuple[
+    Annotated[pd.DataFrame, "train_features"],
+    Annotated[FeatureEngineer, "feature_engineer"]
+]:
+    """
+    ZenML step for scaling and projecting the training features with the FeatureEngineer.
+
+    Args:
+        train_df: The training DataFrame.
+        target: The name of the target column, passed through untransformed.
+        scale_method: 'standard', 'robust' or None for no scaling.
+        n_components: Number of principal components to keep, None keeps all of them.
+
+    Returns:
+        The transformed training DataFrame with the target column, and the fitted FeatureEngineer.
+    """
+    X_train = train_df.drop(columns=[target])
+    feature_engineer = FeatureEngineer(scale_method=scale_method, n_components=n_components).fit(X_train)
+    train_features = feature_engineer.transform(X_train)
+    train_features[target] = train_df[target]
+    return train_features, feature_engineer
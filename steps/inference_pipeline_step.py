@@ -0,0 +1,32 @@
+import pandas as pd
+from zenml import step
+from src.feature_engineering import FeatureEngineer
+from src.impute_data import DataInjector
+from src.inference_pipeline import InferencePipeline
+from sklearn.base import BaseEstimator
+from typing_extensions import Annotated
+
+
+@step
+def inference_pipeline_step(
+    imputer: DataInjector,
+    feature_engineer: FeatureEngineer,
+    model: BaseEstimator,
+    train_df: pd.DataFrame,
+    target: str,
+) -> Annotated[InferencePipeline, "inference_pipeline"]:
+    """
+    ZenML step that bundles the fitted preprocessing and model into one servable artifact.
+
+    Args:
+        imputer: The DataInjector returned by data_imputation_step.
+        feature_engineer: The FeatureEngineer returned by feature_engineering_step.
+        model: The model returned by model_builder_step.
+        train_df: The raw training DataFrame, used for the input column order.
+        target: The name of the target column.
+
+    Returns:
+        The fitted InferencePipeline.
+    """
+    feature_columns = [column for column in train_df.columns if column != target]
+    return InferencePipeline(imputer, feature_engineer, model, feature_columns)
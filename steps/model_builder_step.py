@@ -1,11 +1,8 @@
 import pandas as pd
 from zenml import step
-from src.model_building import (
-    LinearRegressionBuilder,
-    RandomForestBuilder,
-    SVCBuilder,
-)
+from src.model_building import ModelSelector
 from sklearn.base import BaseEstimator
+from typing import Optional
 from typing_extensions import Annotated
 
 
@@ -14,6 +11,7 @@ def model_builder_step(
     train_df: pd.DataFrame,
     target: str,
     model_type: str = "random_forest",
+    n_jobs: Optional[int] = -1,
 ) -> Annotated[BaseEstimator, "trained_model"]:
     """
     ZenML step for building a model.
@@ -21,19 +19,14 @@ def model_builder_step(
     Args:
         train_df: The training DataFrame.
         target: The name of the target column.
-        model_type: The type of model to build ('random_forest', 'svc', 'linear_regression').
+        model_type: The type of model to build ('random_forest', 'svc', 'linear_regression', 'logistic_regression', 'stacking', 'voting').
+        n_jobs: Worker threads for estimators that support it; -1 uses every core.
 
     Returns:
         The trained model.
     """
-    if model_type == "random_forest":
-        builder = RandomForestBuilder(train_df=train_df, target=target)
-    elif model_type == "svc":
-        builder = SVCBuilder(train_df=train_df, target=target)
-    elif model_type == "linear_regression":
-        builder = LinearRegressionBuilder(train_df=train_df, target=target)
-    else:
-        raise ValueError(f"Unknown model type: {model_type}")
+    # Only the selected builder imports its estimator module.
+    builder = ModelSelector.get_model_builder(model_type, train_df=train_df, target=target, n_jobs=n_jobs)
 
     trained_model = builder.build()
     return trained_model
\ No newline at end of file
@@ -1,6 +1,5 @@
 from zenml import step
 from src.model_evaluator import ModelEvaluator
-from sklearn.base import BaseEstimator
 import pandas as pd
 
 @step